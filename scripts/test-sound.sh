@@ -20,7 +20,7 @@ echo ""
 
 for i in $(seq 1 $BUZZ_REPEAT); do
 	echo "Playing sound $i/$BUZZ_REPEAT..."
-	osascript -e "set volume output volume $(echo "$SOUND_VOLUME * 100" | bc)" -e "do shell script \"afplay \\\"$SOUND_PATH\\\"\""
+	afplay -v "$SOUND_VOLUME" "$SOUND_PATH"
 	if [ $i -lt $BUZZ_REPEAT ]; then
 		sleep $BUZZ_INTERVAL_SECONDS
 	fi
@@ -4,20 +4,33 @@ Simple web dashboard for monitoring the on-call buzzer.
 Run with: python -m src.dashboard
 """
 
-import json
+import hashlib
 import os
+import sqlite3
+import threading
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
-from flask import Flask, render_template_string, jsonify, request
+import orjson
+from flask import Flask, Response, request
+from flask_compress import Compress
 from dotenv import load_dotenv
 
+from . import stats_store
+
 load_dotenv()
 
 app = Flask(__name__)
-STATS_FILE = os.getenv("STATS_FILE", "alert_stats.json")
+Compress(app)
+STATS_DB = os.getenv("STATS_DB", "alert_stats.db")
+STATS_CACHE_TTL = 1.0  # seconds
+
+# Last stats payload served by /api/stats
+_stats_cache: Dict[str, Any] = {"loaded_at": 0.0, "stats": None}
+_stats_conn: Optional[sqlite3.Connection] = None
+_stats_file_id: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) of the file _stats_conn has open
+_stats_lock = threading.Lock()
 
 # HTML template for the dashboard
 DASHBOARD_TEMPLATE = """
@@ -125,6 +138,8 @@ DASHBOARD_TEMPLATE = """
 
     <script>
         let autoRefreshInterval = null;
+        let idleTimeout = null;
+        const IDLE_STOP_MS = 10 * 60 * 1000;
         
         function updateDashboard(data) {
             document.getElementById('total-alerts').textContent = data.stats.total_alerts || 0;
@@ -139,6 +154,7 @@ DASHBOARD_TEMPLATE = """
         }
         
         function refreshData() {
+            if (document.hidden) return;
             fetch('/api/stats')
                 .then(response => response.json())
                 .then(data => updateDashboard(data))
@@ -148,20 +164,45 @@ DASHBOARD_TEMPLATE = """
                 });
         }
         
+        function stopAutoRefresh(idle) {
+            const btn = document.getElementById('auto-refresh');
+            clearInterval(autoRefreshInterval);
+            clearTimeout(idleTimeout);
+            autoRefreshInterval = null;
+            idleTimeout = null;
+            btn.textContent = '⏰ Auto Refresh';
+            btn.classList.remove('active');
+            if (idle) {
+                document.getElementById('status').textContent = 'Auto refresh paused (idle) - data may be stale';
+            }
+        }
+        
+        function resetIdleTimer() {
+            if (!autoRefreshInterval) return;
+            clearTimeout(idleTimeout);
+            idleTimeout = setTimeout(() => stopAutoRefresh(true), IDLE_STOP_MS);
+        }
+        
         function toggleAutoRefresh() {
             const btn = document.getElementById('auto-refresh');
             if (autoRefreshInterval) {
-                clearInterval(autoRefreshInterval);
-                autoRefreshInterval = null;
-                btn.textContent = '⏰ Auto Refresh';
-                btn.classList.remove('active');
+                stopAutoRefresh();
             } else {
                 autoRefreshInterval = setInterval(refreshData, 5000);
                 btn.textContent = '⏹️ Stop Auto';
                 btn.classList.add('active');
+                resetIdleTimer();
             }
         }
         
+        // Skip polling while the tab is hidden; catch up once it is visible again
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden) refreshData();
+        });
+        // Stop auto refresh after a stretch with no user interaction
+        document.addEventListener('mousemove', resetIdleTimer);
+        document.addEventListener('keydown', resetIdleTimer);
+        
         // Initial load
         refreshData();
     </script>
@@ -169,31 +210,60 @@ DASHBOARD_TEMPLATE = """
 </html>
 """
 
+# The template has no per-request variables, so render it once at import
+# and let browsers revalidate against a strong ETag.
+_DASHBOARD_HTML = app.jinja_env.from_string(DASHBOARD_TEMPLATE).render().encode("utf-8")
+_DASHBOARD_ETAG = hashlib.md5(_DASHBOARD_HTML).hexdigest()
+
+
+_DEFAULT_STATS: Dict[str, Any] = {
+    "total_alerts": 0,
+    "alerts_today": 0,
+    "last_alert_time": None,
+    "last_reset_date": ""
+}
+
+
+def _close_stats_conn() -> None:
+    global _stats_conn, _stats_file_id
+    if _stats_conn is not None:
+        _stats_conn.close()
+    _stats_conn = None
+    _stats_file_id = None
+
 
 def load_stats() -> Dict[str, Any]:
-    """Load statistics from file."""
-    if not Path(STATS_FILE).exists():
-        return {
-            "total_alerts": 0,
-            "alerts_today": 0,
-            "last_alert_time": None,
-            "last_reset_date": ""
-        }
-    
-    try:
-        with open(STATS_FILE, 'r') as f:
-            return json.load(f)
-    except Exception:
-        return {
-            "total_alerts": 0,
-            "alerts_today": 0,
-            "last_alert_time": None,
-            "last_reset_date": ""
-        }
+    """Load statistics from the shared stats database."""
+    global _stats_conn, _stats_file_id
+    with _stats_lock:
+        try:
+            st = os.stat(STATS_DB)
+        except FileNotFoundError:
+            # The buzzer owns the schema; until it has created the database there is nothing to show
+            _close_stats_conn()
+            return dict(_DEFAULT_STATS)
+        except OSError:
+            return _stats_cache["stats"] or dict(_DEFAULT_STATS)
+        # Reopen if the database was deleted and recreated under the same path
+        file_id = (st.st_dev, st.st_ino)
+        if _stats_conn is not None and file_id != _stats_file_id:
+            _close_stats_conn()
+        if _stats_conn is None:
+            try:
+                _stats_conn = stats_store.connect_readonly(STATS_DB)
+                _stats_file_id = file_id
+            except sqlite3.Error:
+                return _stats_cache["stats"] or dict(_DEFAULT_STATS)
+        try:
+            return stats_store.read_stats(_stats_conn)
+        except sqlite3.Error:
+            # Transient (e.g. locked): keep showing the last good numbers rather than zeros,
+            # and start from a fresh handle next time
+            _close_stats_conn()
+            return _stats_cache["stats"] or dict(_DEFAULT_STATS)
 
 
-def get_config() -> Dict[str, Any]:
-    """Get current configuration."""
+def _build_config() -> Dict[str, Any]:
     return {
         "keywords": os.getenv("KEYWORDS", "@help, help me, urgent"),
         "sound": Path(os.getenv("SOUND_PATH", "/System/Library/Sounds/Submarine.aiff")).stem,
@@ -202,20 +272,70 @@ def get_config() -> Dict[str, Any]:
     }
 
 
+# Environment doesn't change at runtime, so snapshot the config once
+_CONFIG_SNAPSHOT = _build_config()
+
+
+def _refresh_config() -> None:
+    """Rebuild the config snapshot (e.g. after reloading the environment)."""
+    global _CONFIG_SNAPSHOT
+    _CONFIG_SNAPSHOT = _build_config()
+
+
+def get_config() -> Dict[str, Any]:
+    """Get current configuration."""
+    return _CONFIG_SNAPSHOT
+
+
+def cached_stats() -> Dict[str, Any]:
+    """Return stats, querying the database at most once per TTL window."""
+    now = time.monotonic()
+    if _stats_cache["stats"] is not None and now - _stats_cache["loaded_at"] < STATS_CACHE_TTL:
+        return _stats_cache["stats"]
+    stats = load_stats()
+    _stats_cache.update(loaded_at=now, stats=stats)
+    return stats
+
+
+def conditional_response(body: bytes, etag: str, mimetype: str, max_age: int) -> Response:
+    """Build a response with a strong ETag, answering 304 when the client already has it."""
+    # Flask-Compress suffixes the ETag of compressed bodies with ":<algorithm>",
+    # so only compare the part the view produced. If-None-Match uses weak comparison.
+    if_none_match = request.if_none_match
+    matched = etag if if_none_match.star_tag else None
+    for tag in if_none_match.as_set(include_weak=True):
+        if tag.split(":", 1)[0] == etag:
+            matched = tag
+            break
+    if matched is not None:
+        # Echo the validator the client holds (including any ":<algorithm>" suffix) so a
+        # cache can match this 304 to its stored representation; Flask-Compress leaves 304s alone
+        resp = Response(status=304)
+        resp.set_etag(matched)
+    else:
+        resp = Response(body, mimetype=mimetype)
+        resp.set_etag(etag)
+    resp.cache_control.max_age = max_age
+    return resp
+
+
 @app.route('/')
 def dashboard():
     """Main dashboard page."""
-    return render_template_string(DASHBOARD_TEMPLATE)
+    resp = conditional_response(_DASHBOARD_HTML, _DASHBOARD_ETAG, 'text/html', max_age=300)
+    resp.cache_control.public = True
+    return resp
 
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for statistics."""
-    return jsonify({
-        "stats": load_stats(),
+    payload = {
+        "stats": cached_stats(),
         "config": get_config(),
-        "timestamp": datetime.now().isoformat()
-    })
+    }
+    body = orjson.dumps(payload)
+    return conditional_response(body, hashlib.md5(body).hexdigest(), 'application/json', max_age=1)
 
 
 if __name__ == '__main__':
@@ -223,4 +343,10 @@ if __name__ == '__main__':
     print("📊 Dashboard will be available at: http://localhost:5000")
     print("🔄 Press Ctrl+C to stop")
     
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Flask's development server handles one request at a time; fine for local use
+        app.run(host='0.0.0.0', port=5000, debug=False)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=8)
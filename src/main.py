@@ -1,22 +1,36 @@
 import os
 import re
+import functools
+import hashlib
 import time
-import json
 import logging
 import threading
 import subprocess
 import signal
+import sqlite3
 import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Set, Dict, Any
+from typing import List, Optional, Dict, Any, Pattern, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+import orjson
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk.errors import SlackApiError, SlackClientError
 from dotenv import load_dotenv
 
+from . import stats_store
+
+try:
+	from Foundation import NSUserNotification, NSUserNotificationCenter
+except ImportError:  # PyObjC missing or not on macOS; fall back to osascript
+	NSUserNotification = None
+	NSUserNotificationCenter = None
+
 
 # Load environment variables from .env if present
 load_dotenv()
@@ -52,8 +66,8 @@ SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN", "")  # xapp-...
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")  # xoxb-...
 KEYWORDS = [kw.lower() for kw in get_env_list("KEYWORDS", "@help, help me, urgent")]  # case-insensitive match
 KEYWORD_PATTERNS = get_env_list("KEYWORD_PATTERNS", "")  # regex patterns
-CHANNEL_ALLOWLIST = set([c for c in get_env_list("CHANNEL_ALLOWLIST", "")])  # channel names or IDs (comma-separated)
-CHANNEL_BLOCKLIST = set([c for c in get_env_list("CHANNEL_BLOCKLIST", "")])
+CHANNEL_ALLOWLIST = frozenset(get_env_list("CHANNEL_ALLOWLIST", ""))  # channel names or IDs (comma-separated)
+CHANNEL_BLOCKLIST = frozenset(get_env_list("CHANNEL_BLOCKLIST", ""))
 IGNORE_BOTS = str_to_bool(os.getenv("IGNORE_BOTS", "true"))
 SOUND_PATH = os.getenv("SOUND_PATH", "/System/Library/Sounds/Submarine.aiff")
 SOUND_VOLUME = float(os.getenv("SOUND_VOLUME", "0.7"))
@@ -62,12 +76,37 @@ BUZZ_INTERVAL_SECONDS = float(os.getenv("BUZZ_INTERVAL_SECONDS", "0.6"))
 SHOW_MAC_NOTIFICATION = str_to_bool(os.getenv("SHOW_MAC_NOTIFICATION", "true"))
 RATE_LIMIT_MINUTES = int(os.getenv("RATE_LIMIT_MINUTES", "5"))  # cooldown between alerts
 ENABLE_STATS = str_to_bool(os.getenv("ENABLE_STATS", "true"))
-STATS_FILE = os.getenv("STATS_FILE", "alert_stats.json")
+STATS_DB = os.getenv("STATS_DB", "alert_stats.db")
+STATS_FILE = os.getenv("STATS_FILE", "alert_stats.json")  # legacy JSON stats, imported once into STATS_DB
+CHANNEL_CACHE_FILE = os.getenv("CHANNEL_CACHE_FILE", "channels.cache.json")  # empty disables
+CHANNEL_CACHE_TTL_HOURS = float(os.getenv("CHANNEL_CACHE_TTL_HOURS", "24"))
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger("oncall-buzzer")
 
+
+def compile_patterns(patterns: List[str]) -> List[Pattern[str]]:
+	compiled = []
+	for pattern in patterns:
+		try:
+			compiled.append(re.compile(pattern, re.IGNORECASE))
+		except re.error as e:
+			logger.warning("Invalid regex pattern '%s': %s", pattern, e)
+	return compiled
+
+
+def compile_keywords(keywords: List[str]) -> Optional[Pattern[str]]:
+	# One alternation scanned by the C regex engine instead of a Python loop per keyword
+	if not keywords:
+		return None
+	return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+# Compiled once so invalid patterns are reported once, not on every message
+_KEYWORD_RX = compile_keywords(KEYWORDS)
+_COMPILED_PATTERNS = compile_patterns(KEYWORD_PATTERNS)
+
 # Global stats
 alert_stats = AlertStats()
 
@@ -75,100 +114,239 @@ alert_stats = AlertStats()
 class ChannelDirectory:
 	"""Caches Slack channel id<->name lookups for allow/block checks."""
 
-	def __init__(self, app: App):
+	def __init__(self, app: App, cache_file: str = CHANNEL_CACHE_FILE, cache_ttl_hours: float = CHANNEL_CACHE_TTL_HOURS):
 		self.app = app
 		self.id_to_name = {}
 		self.name_to_id = {}
 		self._initialized = False
+		self._lock = threading.Lock()
+		self.cache_file = Path(cache_file) if cache_file else None
+		self.cache_ttl = cache_ttl_hours * 3600
+		# Background refresh bookkeeping; misses on unknown channels trigger at most one refresh per interval
+		self.min_refresh_interval = 60.0
+		self._refresh_lock = threading.Lock()
+		self._refreshing = False
+		self._last_refresh_started = float("-inf")
+		self._loaded_at = 0.0
+		# Ids that missed since the last refresh, and ids a refresh confirmed aren't listed
+		# (DMs, group DMs, channels the bot can't see); the latter wait for the TTL refresh
+		self._pending_misses = set()
+		self._missing = frozenset()
+		# A bot token belongs to exactly one workspace; key the cache on its hash
+		self._cache_key = hashlib.sha256(SLACK_BOT_TOKEN.encode()).hexdigest()[:16]
+
+	def _fetch_channels(self) -> Dict[str, str]:
+		id_to_name = {}
+		cursor = None
+		while True:
+			resp = self.app.client.conversations_list(limit=1000, cursor=cursor, types="public_channel,private_channel")
+			for ch in resp.get("channels", []):
+				cid = ch.get("id")
+				name = ch.get("name")
+				if cid and name:
+					id_to_name[cid] = name
+			cursor = resp.get("response_metadata", {}).get("next_cursor")
+			if not cursor:
+				break
+		return id_to_name
+
+	def _set_channels(self, id_to_name: Dict[str, str]):
+		# Swap in whole dicts so readers on other threads never see a partial load
+		self.name_to_id = {name: cid for cid, name in id_to_name.items()}
+		self.id_to_name = id_to_name
+		self._loaded_at = time.monotonic()
+
+	def _read_cache_file(self) -> Dict[str, Any]:
+		try:
+			return orjson.loads(self.cache_file.read_bytes())
+		except FileNotFoundError:
+			return {}
+		except Exception as e:
+			logger.debug("Ignoring unreadable channel cache %s: %s", self.cache_file, e)
+			return {}
+
+	def _load_cache(self) -> Optional[Tuple[Dict[str, str], datetime]]:
+		if not self.cache_file:
+			return None
+		entry = self._read_cache_file().get(self._cache_key)
+		if not entry:
+			return None
+		try:
+			return entry["channels"], datetime.fromisoformat(entry["fetched_at"])
+		except (KeyError, TypeError, ValueError):
+			return None
+
+	def _save_cache(self, id_to_name: Dict[str, str]):
+		if not self.cache_file:
+			return
+		try:
+			data = self._read_cache_file()
+			data[self._cache_key] = {"fetched_at": datetime.now().isoformat(), "channels": id_to_name}
+			fd, tmp = tempfile.mkstemp(dir=self.cache_file.parent, prefix=self.cache_file.name, suffix=".tmp")
+			with os.fdopen(fd, "wb") as f:
+				f.write(orjson.dumps(data))
+			os.replace(tmp, self.cache_file)
+		except Exception as e:
+			logger.warning("Failed to save channel cache: %s", e)
+
+	def refresh(self):
+		id_to_name = self._fetch_channels()
+		self._set_channels(id_to_name)
+		with self._refresh_lock:
+			checked = self._missing | self._pending_misses
+			self._pending_misses = set()
+			self._missing = frozenset(cid for cid in checked if cid not in id_to_name)
+		self._save_cache(id_to_name)
+		logger.info("Loaded %d channels into cache", len(id_to_name))
+
+	def _refresh_in_background(self):
+		try:
+			self.refresh()
+		except (SlackClientError, OSError) as e:
+			logger.warning("Failed to refresh channel directory: %s", e)
+		finally:
+			self._refreshing = False
+
+	def _schedule_refresh(self):
+		now = time.monotonic()
+		with self._refresh_lock:
+			if self._refreshing or now - self._last_refresh_started < self.min_refresh_interval:
+				return
+			self._refreshing = True
+			self._last_refresh_started = now
+		threading.Thread(target=self._refresh_in_background, daemon=True).start()
 
 	def ensure_loaded(self):
 		if self._initialized:
 			return
-		try:
-			cursor = None
-			while True:
-				resp = self.app.client.conversations_list(limit=1000, cursor=cursor, types="public_channel,private_channel")
-				for ch in resp.get("channels", []):
-					cid = ch.get("id")
-					name = ch.get("name")
-					if cid and name:
-						self.id_to_name[cid] = name
-						self.name_to_id[name] = cid
-				cursor = resp.get("response_metadata", {}).get("next_cursor")
-				if not cursor:
-					break
-			self._initialized = True
-			logger.info("Loaded %d channels into cache", len(self.id_to_name))
-		except SlackApiError as e:
-			logger.warning("Failed to load channel directory: %s", e)
+		with self._lock:
+			if self._initialized:
+				return
+			cached = self._load_cache()
+			if cached:
+				# Serve the cached directory right away, but always reconcile with Slack
+				# off the hot path so channels created or renamed since are picked up
+				channels, fetched_at = cached
+				self._set_channels(channels)
+				self._loaded_at -= max((datetime.now() - fetched_at).total_seconds(), 0.0)
+				self._initialized = True
+				logger.info("Loaded %d channels from %s", len(channels), self.cache_file)
+				self._schedule_refresh()
+				return
+			try:
+				self.refresh()
+				self._initialized = True
+			except SlackApiError as e:
+				logger.warning("Failed to load channel directory: %s", e)
 
 	def name_for(self, channel_id: str) -> Optional[str]:
 		self.ensure_loaded()
-		return self.id_to_name.get(channel_id)
+		name = self.id_to_name.get(channel_id)
+		if not self._initialized:
+			return name
+		# Aged-out directory, or an id no refresh has looked for yet: refresh in the background.
+		# DM ids ("D...") are never listed by _fetch_channels, so they can't trigger one.
+		if time.monotonic() - self._loaded_at >= self.cache_ttl:
+			self._schedule_refresh()
+		elif name is None and not channel_id.startswith("D") and channel_id not in self._missing:
+			with self._refresh_lock:
+				self._pending_misses.add(channel_id)
+			self._schedule_refresh()
+		return name
 
 	def id_for(self, channel_name: str) -> Optional[str]:
 		self.ensure_loaded()
 		return self.name_to_id.get(channel_name)
 
 	def is_allowed(self, channel_id: str) -> bool:
+		# No lists configured: allow everything without touching the directory
+		if not CHANNEL_ALLOWLIST and not CHANNEL_BLOCKLIST:
+			return True
+		# Entries can be names or IDs; resolve the name once for both checks
+		name = self.name_for(channel_id) or ""
 		# If allowlist is empty, allow all (unless blocked)
-		if CHANNEL_ALLOWLIST:
-			# Allowlist entries can be names or IDs
-			name = self.name_for(channel_id) or ""
-			if channel_id not in CHANNEL_ALLOWLIST and name not in CHANNEL_ALLOWLIST:
-				return False
+		if CHANNEL_ALLOWLIST and channel_id not in CHANNEL_ALLOWLIST and name not in CHANNEL_ALLOWLIST:
+			return False
 		# Blocklist check
-		if CHANNEL_BLOCKLIST:
-			name = self.name_for(channel_id) or ""
-			if channel_id in CHANNEL_BLOCKLIST or name in CHANNEL_BLOCKLIST:
-				return False
+		if channel_id in CHANNEL_BLOCKLIST or name in CHANNEL_BLOCKLIST:
+			return False
 		return True
 
 
 class StatsManager:
-	def __init__(self, stats_file: str):
-		self.stats_file = Path(stats_file)
+	def __init__(self, db_path: str, legacy_file: Optional[str] = STATS_FILE):
+		self._lock = threading.Lock()
+		self._conn: Optional[sqlite3.Connection] = None
+		try:
+			self._conn = stats_store.connect(db_path)
+		except sqlite3.Error as e:
+			# Keep alerting; stats just live in memory for this run
+			logger.warning("Failed to open stats database %s, stats will not be persisted: %s", db_path, e)
+			return
 		self.load_stats()
+		if legacy_file:
+			self._import_legacy(Path(legacy_file))
 
 	def load_stats(self):
-		if self.stats_file.exists():
-			try:
-				with open(self.stats_file, 'r') as f:
-					data = json.load(f)
-					alert_stats.total_alerts = data.get('total_alerts', 0)
-					alert_stats.alerts_today = data.get('alerts_today', 0)
-					alert_stats.last_reset_date = data.get('last_reset_date', "")
-					if data.get('last_alert_time'):
-						alert_stats.last_alert_time = datetime.fromisoformat(data['last_alert_time'])
-			except Exception as e:
-				logger.warning("Failed to load stats: %s", e)
+		if self._conn is None:
+			return
+		try:
+			data = stats_store.read_stats(self._conn)
+			alert_stats.total_alerts = data['total_alerts']
+			alert_stats.alerts_today = data['alerts_today']
+			alert_stats.last_reset_date = data['last_reset_date']
+			if data['last_alert_time']:
+				alert_stats.last_alert_time = datetime.fromisoformat(data['last_alert_time'])
+		except (sqlite3.Error, ValueError) as e:
+			logger.warning("Failed to load stats: %s", e)
+
+	def _import_legacy(self, path: Path):
+		# Carry over counts from the old JSON stats file into an empty database
+		if alert_stats.total_alerts or not path.exists():
+			return
+		try:
+			data = orjson.loads(path.read_bytes())
+			alert_stats.total_alerts = data.get('total_alerts', 0)
+			alert_stats.alerts_today = data.get('alerts_today', 0)
+			alert_stats.last_reset_date = data.get('last_reset_date', "")
+			if data.get('last_alert_time'):
+				alert_stats.last_alert_time = datetime.fromisoformat(data['last_alert_time'])
+			self.save_stats()
+			logger.info("Imported stats from %s", path)
+		except Exception as e:
+			logger.warning("Failed to import stats from %s: %s", path, e)
 
 	def save_stats(self):
+		with self._lock:
+			self._write()
+
+	def _write(self):
+		if self._conn is None:
+			return
 		try:
-			data = {
+			stats_store.write_stats(self._conn, {
 				'total_alerts': alert_stats.total_alerts,
 				'alerts_today': alert_stats.alerts_today,
 				'last_reset_date': alert_stats.last_reset_date,
 				'last_alert_time': alert_stats.last_alert_time.isoformat() if alert_stats.last_alert_time else None
-			}
-			with open(self.stats_file, 'w') as f:
-				json.dump(data, f, indent=2)
-		except Exception as e:
+			})
+		except sqlite3.Error as e:
 			logger.warning("Failed to save stats: %s", e)
 
 	def record_alert(self):
 		now = datetime.now()
 		today = now.date().isoformat()
 		
-		# Reset daily counter if new day
-		if alert_stats.last_reset_date != today:
-			alert_stats.alerts_today = 0
-			alert_stats.last_reset_date = today
-		
-		alert_stats.total_alerts += 1
-		alert_stats.alerts_today += 1
-		alert_stats.last_alert_time = now
-		self.save_stats()
+		with self._lock:
+			# Reset daily counter if new day
+			if alert_stats.last_reset_date != today:
+				alert_stats.alerts_today = 0
+				alert_stats.last_reset_date = today
+			
+			alert_stats.total_alerts += 1
+			alert_stats.alerts_today += 1
+			alert_stats.last_alert_time = now
+			self._write()
 
 	def is_rate_limited(self) -> bool:
 		if not alert_stats.last_alert_time or RATE_LIMIT_MINUTES <= 0:
@@ -177,18 +355,66 @@ class StatsManager:
 		return datetime.now() - alert_stats.last_alert_time < cooldown
 
 
+def applescript_string(value: str) -> str:
+	"""Quote a Python string as a single-line AppleScript string literal."""
+	escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+	return f'"{escaped}"'
+
+
+class OsaScriptRunner:
+	"""Keeps one `osascript -i` process alive and feeds it scripts line by line."""
+
+	def __init__(self):
+		self._proc: Optional[subprocess.Popen] = None
+		self._lock = threading.Lock()
+
+	def _ensure_running(self) -> subprocess.Popen:
+		if self._proc is None or self._proc.poll() is not None:
+			self._proc = subprocess.Popen(
+				["osascript", "-i"],
+				stdin=subprocess.PIPE,
+				stdout=subprocess.DEVNULL,
+				stderr=subprocess.DEVNULL,
+				text=True,
+				bufsize=1,
+			)
+		return self._proc
+
+	def run(self, script: str):
+		with self._lock:
+			try:
+				proc = self._ensure_running()
+				proc.stdin.write(script + "\n")
+				proc.stdin.flush()
+			except (OSError, ValueError):
+				# Helper died; the next call spawns a fresh one
+				self._proc = None
+				raise
+
+	def close(self):
+		with self._lock:
+			if self._proc and self._proc.poll() is None:
+				self._proc.terminate()
+			self._proc = None
+
+
+osascript = OsaScriptRunner()
+
+# Sound and notification work runs here so the Slack event thread never waits on it
+alert_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="buzz")
+
+
 class Buzzer:
 	def __init__(self, sound_config: SoundConfig):
 		self.sound_config = sound_config
 		self.is_playing = False
 		self._lock = threading.Lock()
+		# afplay -v sets per-play volume without touching the system output volume
+		self._play_cmd = ["afplay", "-v", f"{sound_config.volume:.2f}", sound_config.path]
 
 	def _play_once(self):
 		try:
-			# Use osascript to control volume and play sound
-			volume_script = f'set volume output volume {int(self.sound_config.volume * 100)}'
-			play_script = f'do shell script "afplay \\"{self.sound_config.path}\\""'
-			subprocess.run(["osascript", "-e", volume_script, "-e", play_script], check=False)
+			subprocess.run(self._play_cmd, check=False)
 		except Exception as e:
 			logger.error("Failed to play sound: %s", e)
 
@@ -208,40 +434,47 @@ class Buzzer:
 				with self._lock:
 					self.is_playing = False
 		
-		threading.Thread(target=run, daemon=True).start()
+		alert_executor.submit(run)
 
 
 def show_notification(title: str, message: str):
 	if not SHOW_MAC_NOTIFICATION:
 		return
 	try:
-		# Use AppleScript notification for macOS
-		script = f'display notification "{message}" with title "{title}"'
-		subprocess.run(["osascript", "-e", script], check=False)
+		# Post in-process via PyObjC when available
+		center = NSUserNotificationCenter.defaultUserNotificationCenter() if NSUserNotificationCenter else None
+		if center is not None:
+			note = NSUserNotification.alloc().init()
+			note.setTitle_(title)
+			note.setInformativeText_(message)
+			center.deliverNotification_(note)
+			return
+		# Otherwise use AppleScript notification for macOS
+		osascript.run(f'display notification {applescript_string(message)} with title {applescript_string(title)}')
 	except Exception as e:
 		logger.debug("Failed to show macOS notification: %s", e)
 
 
-def text_matches(text: str, keywords: List[str], patterns: List[str]) -> bool:
-	lowered = text.lower()
+def text_matches(text: str, keywords: Optional[Pattern[str]], patterns: List[Pattern[str]]) -> bool:
+	# Nothing configured (or nothing to scan): skip the regex engine entirely
+	if not text or (keywords is None and not patterns):
+		return False
 	
-	# Check simple keyword matches
-	if any(kw in lowered for kw in keywords):
+	# Check simple keyword matches (case-insensitive alternation)
+	if keywords is not None and keywords.search(text):
 		return True
 	
-	# Check regex patterns
-	for pattern in patterns:
-		try:
-			if re.search(pattern, text, re.IGNORECASE):
-				return True
-		except re.error as e:
-			logger.warning("Invalid regex pattern '%s': %s", pattern, e)
+	# Check precompiled regex patterns
+	for rx in patterns:
+		if rx.search(text):
+			return True
 	
 	return False
 
 
+@functools.cache
 def get_available_sounds() -> List[str]:
-	"""Get list of available macOS system sounds."""
+	"""Get list of available macOS system sounds (checked once per process)."""
 	sound_paths = [
 		"/System/Library/Sounds/Submarine.aiff",
 		"/System/Library/Sounds/Glass.aiff", 
@@ -257,7 +490,6 @@ def get_available_sounds() -> List[str]:
 		"/System/Library/Sounds/Funk.aiff",
 		"/System/Library/Sounds/Hero.aiff",
 		"/System/Library/Sounds/Morse.aiff",
-		"/System/Library/Sounds/Ping.aiff",
 		"/System/Library/Sounds/Popcorn.aiff",
 		"/System/Library/Sounds/Sonar.aiff",
 		"/System/Library/Sounds/Strum.aiff"
@@ -279,10 +511,10 @@ def build_app() -> App:
 	buzzer = Buzzer(sound_config)
 	
 	# Initialize stats manager
-	stats_manager = StatsManager(STATS_FILE) if ENABLE_STATS else None
+	stats_manager = StatsManager(STATS_DB) if ENABLE_STATS else None
 
-	# Keep a small LRU-like set to avoid buzzing multiple times for the same event
-	recent_event_ids: Set[str] = set()
+	# Keep a small LRU of event ids to avoid buzzing multiple times for the same event
+	recent_event_ids: "OrderedDict[str, None]" = OrderedDict()
 	MAX_RECENT = 500
 
 	def should_process(event: dict) -> bool:
@@ -290,23 +522,36 @@ def build_app() -> App:
 		event_id = event.get("client_msg_id") or event.get("ts")
 		if event_id:
 			if event_id in recent_event_ids:
+				recent_event_ids.move_to_end(event_id)
 				return False
-			recent_event_ids.add(event_id)
+			recent_event_ids[event_id] = None
 			if len(recent_event_ids) > MAX_RECENT:
-				# Drop oldest arbitrarily by recreating set from last N (not strictly ordered)
-				recent_event_ids.clear()
-				recent_event_ids.add(event_id)
+				# Evict only the least recently seen id
+				recent_event_ids.popitem(last=False)
 		# Ignore bot messages when configured
 		if IGNORE_BOTS and (event.get("subtype") == "bot_message" or event.get("bot_id")):
 			return False
 		return True
 
+	# Bind hot-path callables once so each event skips global/attribute lookups
+	_is_allowed = directory.is_allowed
+	_name_for = directory.name_for
+	_matches = text_matches
+	_keyword_rx = _KEYWORD_RX
+	_patterns = _COMPILED_PATTERNS
+	_buzz = buzzer.buzz
+	_submit = alert_executor.submit
+	_notify = show_notification
+	_record = stats_manager.record_alert if stats_manager else None
+	_rate_limited = stats_manager.is_rate_limited if stats_manager else None
+
 	@app.event("message")
 	def handle_message_events(body, logger: logging.Logger, event, say):  # type: ignore
 		try:
-			channel = event.get("channel")
-			text = event.get("text") or ""
-			user = event.get("user", "unknown")
+			get = event.get
+			channel = get("channel")
+			text = get("text") or ""
+			user = get("user", "unknown")
 			
 			if not text or not channel:
 				return
@@ -315,25 +560,25 @@ def build_app() -> App:
 				return
 
 			# Channel allow/block
-			if not directory.is_allowed(channel):
+			if not _is_allowed(channel):
 				return
 
 			# Check for rate limiting
-			if stats_manager and stats_manager.is_rate_limited():
+			if _rate_limited and _rate_limited():
 				logger.debug("Rate limited, skipping alert")
 				return
 
-			if text_matches(text, KEYWORDS, KEYWORD_PATTERNS):
-				channel_name = directory.name_for(channel) or channel
+			if _matches(text, _keyword_rx, _patterns):
+				channel_name = _name_for(channel) or channel
 				logger.info("🚨 ALERT: channel=%s user=%s text=%s", channel_name, user, text[:200])
 				
 				# Record stats
-				if stats_manager:
-					stats_manager.record_alert()
+				if _record:
+					_record()
 				
 				# Trigger buzzer and notification
-				buzzer.buzz()
-				show_notification("🚨 On-Call Alert", f"Channel: {channel_name}\n{text[:180]}")
+				_buzz()
+				_submit(_notify, "🚨 On-Call Alert", f"Channel: {channel_name}\n{text[:180]}")
 				
 		except Exception as e:
 			logger.exception("Error handling message event: %s", e)
@@ -365,6 +610,8 @@ def build_app() -> App:
 
 def signal_handler(signum, frame):
 	logger.info("Received signal %d, shutting down gracefully...", signum)
+	alert_executor.shutdown(wait=False, cancel_futures=True)
+	osascript.close()
 	sys.exit(0)
 
 
@@ -0,0 +1,57 @@
+"""
+SQLite-backed alert statistics shared by the buzzer and the dashboard.
+
+The database runs in WAL mode so the dashboard can read a consistent
+snapshot while the buzzer is writing, without either side blocking.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_alerts INTEGER NOT NULL DEFAULT 0,
+    alerts_today INTEGER NOT NULL DEFAULT 0,
+    last_alert_time TEXT,
+    last_reset_date TEXT NOT NULL DEFAULT ''
+);
+INSERT OR IGNORE INTO stats (id) VALUES (1);
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open the stats database, creating the single stats row if needed."""
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def connect_readonly(path: str) -> sqlite3.Connection:
+    """Open an existing stats database for reading only (no pragmas or schema writes)."""
+    uri = Path(path).resolve().as_uri() + "?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+def read_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Read the current stats row as a plain dict."""
+    row = conn.execute(
+        "SELECT total_alerts, alerts_today, last_alert_time, last_reset_date FROM stats WHERE id = 1"
+    ).fetchone()
+    return {
+        "total_alerts": row[0],
+        "alerts_today": row[1],
+        "last_alert_time": row[2],
+        "last_reset_date": row[3],
+    }
+
+
+def write_stats(conn: sqlite3.Connection, stats: Dict[str, Any]) -> None:
+    """Overwrite the stats row in a single statement."""
+    conn.execute(
+        "UPDATE stats SET total_alerts = ?, alerts_today = ?, last_alert_time = ?, last_reset_date = ? WHERE id = 1",
+        (stats["total_alerts"], stats["alerts_today"], stats["last_alert_time"], stats["last_reset_date"]),
+    )